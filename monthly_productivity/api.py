@@ -0,0 +1,155 @@
+# Copyright (c) 2025, raion digital and contributors
+# For license information, please see license.txt
+
+import frappe
+from frappe import _
+from frappe.utils import add_to_date, cint, flt, now_datetime
+
+from monthly_productivity.monthly_productivity.doctype.monthly_productivity.monthly_productivity import (
+	QUEUED_SUBMIT_TIMEOUT,
+)
+from monthly_productivity.utils import read_only
+
+DEFAULT_PAGE_LENGTH = 500
+MAX_PAGE_LENGTH = 5000
+# `modified` is stamped when a save starts, not when it commits, so rows modified
+# within this many seconds are held back until a later sync. The delay must outlast
+# the longest write transaction (a queued submit) plus replica lag; it can be raised,
+# but not lowered below that, with `monthly_productivity_change_feed_delay`.
+MIN_CHANGE_FEED_DELAY = QUEUED_SUBMIT_TIMEOUT
+DEFAULT_CHANGE_FEED_DELAY = MIN_CHANGE_FEED_DELAY + 300
+
+
+@frappe.whitelist()
+@read_only()
+def get_execution_fact_changes(cursor=None, page_length=DEFAULT_PAGE_LENGTH):
+	"""Return execution facts changed after `cursor`, oldest first.
+
+	Each fact is one Execution Schedule Entry of a submitted Monthly Productivity,
+	flattened with its parent; drafts are not exported. Rows of cancelled documents,
+	and of cancelled documents that have since been deleted (from `Deleted Document`),
+	are returned as tombstones (`"deleted": 1`). Pass the returned `next_cursor` back
+	to fetch the next page; keep it between syncs to get only rows modified since the
+	last run.
+	"""
+	frappe.has_permission("Monthly Productivity", "read", throw=True)
+
+	page_length = min(max(cint(page_length), 1), MAX_PAGE_LENGTH)
+	modified, name = parse_cursor(cursor)
+	values = {"modified": modified, "name": name, "upper_bound": get_upper_bound(), "limit": page_length + 1}
+
+	rows = frappe.db.sql(
+		"""
+		SELECT
+			ese.name,
+			ese.modified,
+			ese.parent,
+			mp.company,
+			mp.report_month,
+			ese.sales_invoice,
+			ese.customer,
+			ese.sales_person,
+			ese.execution_percentage,
+			ese.cumulative_execution,
+			ese.invoice_total,
+			ese.actual_executed_value,
+			ese.delivery_status,
+			ese.sales_person_commission AS sales_person_commission_percentage,
+			COALESCE(mp.total_commission_percentage, 0) AS shareholder_commission_percentage,
+			mp.docstatus
+		FROM `tabExecution Schedule Entry` ese
+		JOIN `tabMonthly Productivity` mp ON mp.name = ese.parent
+		WHERE ese.parenttype = 'Monthly Productivity'
+		  AND mp.docstatus IN (1, 2)
+		  AND (ese.modified > %(modified)s OR (ese.modified = %(modified)s AND ese.name > %(name)s))
+		  AND ese.modified < %(upper_bound)s
+		ORDER BY ese.modified, ese.name
+		LIMIT %(limit)s
+		""",
+		values,
+		as_dict=1,
+	)
+	# Both sources are ordered by (modified, name), so the first page of the merge is exact
+	rows = sorted(rows + get_deleted_documents(values), key=lambda r: (r.modified, r.name))
+
+	has_more = len(rows) > page_length
+	rows = rows[:page_length]
+
+	facts = []
+	for row in rows:
+		facts.extend(make_deleted_facts(row) if row.get("deleted_document") else [make_fact(row)])
+	next_cursor = make_cursor(rows[-1].modified, rows[-1].name) if rows else cursor
+	return {"facts": facts, "next_cursor": next_cursor, "has_more": has_more}
+
+
+def get_deleted_documents(values):
+	"""Deleted Monthly Productivity documents after the cursor, keyed like execution rows."""
+	return frappe.db.sql(
+		"""
+		SELECT dd.name, dd.creation AS modified, dd.deleted_name, dd.data, 1 AS deleted_document
+		FROM `tabDeleted Document` dd
+		WHERE dd.deleted_doctype = 'Monthly Productivity'
+		  AND (dd.creation > %(modified)s OR (dd.creation = %(modified)s AND dd.name > %(name)s))
+		  AND dd.creation < %(upper_bound)s
+		ORDER BY dd.creation, dd.name
+		LIMIT %(limit)s
+		""",
+		values,
+		as_dict=1,
+	)
+
+
+def make_deleted_facts(row):
+	"""Tombstones for the execution rows of a deleted document that had been exported."""
+	data = frappe.parse_json(row.data or "{}")
+	if cint(data.get("docstatus")) == 0:
+		return []
+	return [
+		{
+			"name": child.get("name"),
+			"parent": row.deleted_name,
+			"modified": row.modified,
+			"docstatus": 2,
+			"deleted": 1,
+		}
+		for child in data.get("productivity") or []
+	]
+
+
+def get_upper_bound():
+	delay = max(
+		cint(frappe.conf.get("monthly_productivity_change_feed_delay", DEFAULT_CHANGE_FEED_DELAY)),
+		MIN_CHANGE_FEED_DELAY,
+	)
+	return add_to_date(now_datetime(), seconds=-delay)
+
+
+def make_fact(row):
+	if row.docstatus == 2:
+		return {
+			"name": row.name,
+			"parent": row.parent,
+			"modified": row.modified,
+			"docstatus": 2,
+			"deleted": 1,
+		}
+
+	executed = flt(row.actual_executed_value)
+	row.sales_person_commission = flt(executed * flt(row.sales_person_commission_percentage) / 100.0, 2)
+	row.shareholder_commission = flt(executed * flt(row.shareholder_commission_percentage) / 100.0, 2)
+	row.deleted = 0
+	return row
+
+
+def make_cursor(modified, name):
+	return f"{modified}|{name}"
+
+
+def parse_cursor(cursor):
+	"""Split a `modified|name` cursor; an empty cursor starts from the beginning."""
+	if not cursor:
+		return "1900-01-01 00:00:00", ""
+	modified, sep, name = cursor.partition("|")
+	if not sep:
+		frappe.throw(_("Invalid cursor {0}").format(cursor), title=_("Change Feed"))
+	return modified, name
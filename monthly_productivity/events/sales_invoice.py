@@ -0,0 +1,119 @@
+# Copyright (c) 2025, raion digital and contributors
+# For license information, please see license.txt
+
+"""Keep draft execution rows in sync with their Sales Invoice totals."""
+
+import frappe
+from frappe.utils import flt, now
+
+from monthly_productivity.monthly_productivity.doctype.monthly_productivity.monthly_productivity import (
+	get_net_invoice_total,
+)
+
+
+def on_submit(doc, method=None):
+	if doc.get("is_return") and doc.get("return_against"):
+		refresh_executed_values(doc.return_against)
+	elif doc.get("amended_from"):
+		refresh_executed_values(doc.name, previous_invoice=doc.amended_from)
+
+
+def on_cancel(doc, method=None):
+	if doc.get("is_return") and doc.get("return_against"):
+		refresh_executed_values(doc.return_against)
+
+
+def refresh_executed_values(sales_invoice, previous_invoice=None):
+	"""Update `invoice_total` and `actual_executed_value` on draft rows for `sales_invoice`.
+
+	Rows still pointing at `previous_invoice` (the cancelled original of an amendment)
+	are moved to `sales_invoice`. `actual_executed_value` is only recomputed where it
+	still equals the old total times the execution %; values entered by hand are kept.
+	Commission totals of the affected documents are then recomputed together.
+	"""
+	invoices = [sales_invoice, previous_invoice] if previous_invoice else [sales_invoice]
+	parents = frappe.db.sql_list(
+		"""
+		SELECT DISTINCT ese.parent
+		FROM `tabExecution Schedule Entry` ese
+		WHERE ese.sales_invoice IN %(invoices)s
+		  AND ese.parenttype = 'Monthly Productivity'
+		  AND ese.docstatus = 0
+		""",
+		{"invoices": invoices},
+	)
+	if not parents:
+		return
+
+	total = get_net_invoice_total(sales_invoice)
+	frappe.db.sql(
+		"""
+		UPDATE `tabExecution Schedule Entry` ese
+		SET ese.sales_invoice = %(sales_invoice)s,
+			-- assigned before invoice_total so the comparison sees the old total
+			ese.actual_executed_value = CASE
+				WHEN COALESCE(ese.actual_executed_value, 0) = 0
+					OR ABS(ese.actual_executed_value
+						- COALESCE(ese.invoice_total, 0) * COALESCE(ese.execution_percentage, 0) / 100) <= 0.01
+				THEN ROUND(%(total)s * COALESCE(ese.execution_percentage, 0) / 100, 2)
+				ELSE ese.actual_executed_value
+			END,
+			ese.invoice_total = %(total)s,
+			ese.modified = %(modified)s
+		WHERE ese.sales_invoice IN %(invoices)s
+		  AND ese.parenttype = 'Monthly Productivity'
+		  AND ese.docstatus = 0
+		""",
+		{"sales_invoice": sales_invoice, "total": total, "invoices": invoices, "modified": now()},
+	)
+	recompute_commission_totals(parents)
+
+
+def recompute_commission_totals(parents):
+	"""Recompute commission rows and parent totals for draft `parents` in one pass.
+
+	Mirrors `MonthlyProductivity._compute_shareholder_commissions` using stored
+	commission percentages.
+	"""
+	base_by_parent = dict(
+		frappe.db.sql(
+			"""
+			SELECT parent, COALESCE(SUM(actual_executed_value), 0)
+			FROM `tabExecution Schedule Entry`
+			WHERE parent IN %(parents)s
+			  AND parenttype = 'Monthly Productivity'
+			GROUP BY parent
+			""",
+			{"parents": parents},
+		)
+	)
+	commission_rows = frappe.db.sql(
+		"""
+		SELECT name, parent, commission_percentage
+		FROM `tabMonthly Productivity Commission Row`
+		WHERE parent IN %(parents)s
+		  AND parenttype = 'Monthly Productivity'
+		""",
+		{"parents": parents},
+		as_dict=1,
+	)
+
+	row_updates = {}
+	totals = {parent: [0.0, 0.0] for parent in parents}
+	for row in commission_rows:
+		base = flt(flt(base_by_parent.get(row.parent)), 2)
+		pct = flt(row.commission_percentage)
+		amt = round(base * pct / 100.0, 2)
+		row_updates[row.name] = {"commission_amount": amt}
+		totals[row.parent][0] += pct
+		totals[row.parent][1] += amt
+
+	if row_updates:
+		frappe.db.bulk_update("Monthly Productivity Commission Row", row_updates)
+	frappe.db.bulk_update(
+		"Monthly Productivity",
+		{
+			parent: {"total_commission_percentage": flt(pct, 2), "total_commission_amount": flt(amt, 2)}
+			for parent, (pct, amt) in totals.items()
+		},
+	)
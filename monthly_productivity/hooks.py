@@ -145,6 +145,13 @@ app_license = "mit"
 # 	}
 # }
 
+doc_events = {
+	"Sales Invoice": {
+		"on_submit": "monthly_productivity.events.sales_invoice.on_submit",
+		"on_cancel": "monthly_productivity.events.sales_invoice.on_cancel",
+	}
+}
+
 # Scheduled Tasks
 # ---------------
 
@@ -0,0 +1,92 @@
+# Copyright (c) 2025, raion digital and contributors
+# For license information, please see license.txt
+
+"""Cached productivity KPIs for dashboard charts and number cards.
+
+Results reuse the Summary View aggregation of the Monthly Productivity Summary
+report and are cached per company and time window for
+`monthly_productivity_kpi_cache_ttl` seconds (site config, default 900), so all
+viewers of a dashboard share one computation per interval. Period labels are
+translated, so the cache is also keyed by language.
+"""
+
+import frappe
+from frappe import _
+from frappe.utils import cint, getdate
+from frappe.utils.data import get_timespan_date_range
+
+from monthly_productivity.monthly_productivity.report.monthly_productivity_summary.monthly_productivity_summary import (
+	get_summary_data,
+)
+from monthly_productivity.utils import read_only
+
+DEFAULT_KPI_CACHE_TTL = 900
+DEFAULT_TIMESPAN = "Last Year"
+KPI_CACHE_PREFIX = "monthly_productivity:kpi:"
+KPI_FIELDS = ("executed_value", "profit_loss", "sp_commission", "shareholder_commission")
+
+
+def get_kpi_cache_ttl() -> int:
+	return cint(frappe.conf.get("monthly_productivity_kpi_cache_ttl", DEFAULT_KPI_CACHE_TTL))
+
+
+def get_kpi_data(filters=None):
+	"""Return the Summary View rows (one per month) for `filters`, from cache when fresh."""
+	frappe.has_permission("Monthly Productivity", "read", throw=True)
+	filters = frappe.parse_json(filters or {})
+	company = filters.get("company") or frappe.defaults.get_user_default("Company")
+	if not company:
+		return []
+	# The cache is shared by all viewers, so company user permissions are checked here
+	frappe.has_permission("Company", "read", company, throw=True)
+
+	from_date, to_date = get_timespan_date_range((filters.get("timespan") or DEFAULT_TIMESPAN).lower())
+	cache_key = f"{KPI_CACHE_PREFIX}{frappe.local.lang}:{company}:{getdate(from_date)}:{getdate(to_date)}"
+
+	data = frappe.cache.get_value(cache_key)
+	if data is None:
+		data = _compute_kpi_data(company, from_date, to_date)
+		frappe.cache.set_value(cache_key, data, expires_in_sec=get_kpi_cache_ttl())
+	return data
+
+
+@read_only()
+def _compute_kpi_data(company, from_date, to_date):
+	data, _chart, _summary = get_summary_data(
+		frappe._dict(company=company, from_date=from_date, to_date=to_date), is_yearly_view=False
+	)
+	return data
+
+
+def get_kpi_total(fieldname, filters=None):
+	return sum(row.get(fieldname) or 0 for row in get_kpi_data(filters))
+
+
+@frappe.whitelist()
+def get_executed_value(filters=None):
+	return {"value": get_kpi_total("executed_value", filters), "fieldtype": "Currency"}
+
+
+@frappe.whitelist()
+def get_profit_loss(filters=None):
+	return {"value": get_kpi_total("profit_loss", filters), "fieldtype": "Currency"}
+
+
+@frappe.whitelist()
+def get_total_commission(filters=None):
+	value = get_kpi_total("sp_commission", filters) + get_kpi_total("shareholder_commission", filters)
+	return {"value": value, "fieldtype": "Currency"}
+
+
+def get_kpi_chart(filters=None, fields=KPI_FIELDS):
+	labels = {
+		"executed_value": _("Executed Value"),
+		"profit_loss": _("Profit or Loss"),
+		"sp_commission": _("Sales Person Commission"),
+		"shareholder_commission": _("Shareholder Commission"),
+	}
+	data = get_kpi_data(filters)
+	return {
+		"labels": [row["period"] for row in data],
+		"datasets": [{"name": labels[f], "values": [row[f] for row in data]} for f in fields],
+	}
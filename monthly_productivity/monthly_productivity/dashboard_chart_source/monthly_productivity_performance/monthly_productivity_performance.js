@@ -0,0 +1,24 @@
+// Copyright (c) 2025, raion digital and contributors
+// For license information, please see license.txt
+
+frappe.provide("frappe.dashboards.chart_sources");
+
+frappe.dashboards.chart_sources["Monthly Productivity Performance"] = {
+	method: "monthly_productivity.monthly_productivity.dashboard_chart_source.monthly_productivity_performance.monthly_productivity_performance.get",
+	filters: [
+		{
+			fieldname: "company",
+			label: __("Company"),
+			fieldtype: "Link",
+			options: "Company",
+			default: frappe.defaults.get_user_default("Company"),
+		},
+		{
+			fieldname: "timespan",
+			label: __("Timespan"),
+			fieldtype: "Select",
+			options: ["Last Quarter", "Last 6 Months", "Last Year", "This Year"],
+			default: "Last Year",
+		},
+	],
+};
@@ -0,0 +1,21 @@
+# Copyright (c) 2025, raion digital and contributors
+# For license information, please see license.txt
+
+import frappe
+
+from monthly_productivity.kpi import get_kpi_chart
+
+
+@frappe.whitelist()
+def get(
+	chart_name=None,
+	chart=None,
+	no_cache=None,
+	filters=None,
+	from_date=None,
+	to_date=None,
+	timespan=None,
+	time_interval=None,
+	heatmap_year=None,
+):
+	return get_kpi_chart(filters, fields=("executed_value", "profit_loss"))
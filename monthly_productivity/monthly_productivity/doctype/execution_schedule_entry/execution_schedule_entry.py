@@ -1,9 +1,14 @@
 # Copyright (c) 2025, raion digital and contributors
 # For license information, please see license.txt
 
-# import frappe
+import frappe
 from frappe.model.document import Document
 
 
 class ExecutionScheduleEntry(Document):
 	pass
+
+
+def on_doctype_update():
+	# The summary report joins from Monthly Productivity on `parent` and narrows by sales person
+	frappe.db.add_index("Execution Schedule Entry", ["parent", "sales_person"])
@@ -35,6 +35,30 @@ frappe.ui.form.on('Monthly Productivity', {
     }));
   },
 
+  refresh(frm) {
+    if (frm.doc.__onload && frm.doc.__onload.submit_queued) {
+      frm.set_intro(__('This document is being submitted in the background and is locked until it completes.'), 'orange');
+    }
+
+    // Progress of a queued submit (see MonthlyProductivity.submit)
+    frappe.realtime.off('monthly_productivity_submit_progress');
+    frappe.realtime.on('monthly_productivity_submit_progress', (data) => {
+      if (data.failed) {
+        frm.dashboard.hide_progress(__('Submitting'));
+        frappe.msgprint({ title: __('Submission Failed'), indicator: 'red', message: data.description });
+        frm.reload_doc();
+        return;
+      }
+      if (data.total) {
+        frm.dashboard.show_progress(__('Submitting'), (data.progress / data.total) * 100, data.description);
+      }
+      if (data.progress >= data.total) {
+        frm.dashboard.hide_progress(__('Submitting'));
+        frm.reload_doc();
+      }
+    });
+  },
+
   // When a productivity row is added, just ensure numbers recalc once user fills fields
   productivity_add(frm, cdt, cdn) {
     // nothing to prefill; calculations happen on field change
@@ -50,9 +74,13 @@ frappe.ui.form.on('Execution Schedule Entry', {
     const row = locals[cdt][cdn];
     if (!row.sales_invoice) { return; }
 
-    frappe.db.get_value('Sales Invoice', row.sales_invoice, 'grand_total')
+    // Invoice total net of returns, same as the Sales Invoice hooks keep it
+    frappe.call({
+      method: 'monthly_productivity.monthly_productivity.doctype.monthly_productivity.monthly_productivity.get_invoice_total',
+      args: { sales_invoice: row.sales_invoice }
+    })
       .then(r => {
-        const total = (r && r.message && r.message.grand_total) || 0;
+        const total = (r && r.message) || 0;
         frappe.model.set_value(cdt, cdn, 'invoice_total', total);
 
         const actual = total * (flt(row.execution_percentage || 0) / 100.0);
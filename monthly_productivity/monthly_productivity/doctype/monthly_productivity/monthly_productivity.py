@@ -4,7 +4,15 @@
 import frappe
 from frappe import _
 from frappe.model.document import Document
-from frappe.utils import flt
+from frappe.utils import cint, flt
+
+from monthly_productivity.utils import read_only
+
+# Documents with at least this many execution rows are submitted in a background job.
+# Override with `monthly_productivity_queue_submit_threshold` in site config.
+DEFAULT_QUEUE_SUBMIT_THRESHOLD = 500
+QUEUED_SUBMIT_TIMEOUT = 4600
+SUBMIT_PROGRESS_EVENT = "monthly_productivity_submit_progress"
 
 
 class MonthlyProductivity(Document):
@@ -16,6 +24,78 @@ class MonthlyProductivity(Document):
         self._validate_and_compute_productivity_rows()
         self._compute_shareholder_commissions()
 
+    def onload(self):
+        self.set_onload("submit_queued", self.docstatus == 0 and self.is_locked)
+
+    def submit(self):
+        """Submit synchronously, or queue the submission for large documents."""
+        if self._should_queue_submit():
+            # savedocs sets docstatus = 1 before calling submit and then returns this
+            # document to the form; it is still a draft until the job finishes.
+            self.docstatus = 0
+            self.queue_action("submit", timeout=QUEUED_SUBMIT_TIMEOUT)
+            frappe.msgprint(
+                _("The document has {0} rows and is being submitted in the background.").format(
+                    len(self.productivity)
+                ),
+                alert=True,
+            )
+        else:
+            self._submit()
+
+    def _submit(self):
+        self.flags.publish_submit_progress = self._should_queue_submit()
+        if not self.flags.publish_submit_progress:
+            return super()._submit()
+
+        # `execute_action` unlocks the document before running the job; lock it again
+        # so it cannot be edited or submitted twice while this submission runs.
+        self.lock()
+        self.flags.holding_submit_lock = True
+        try:
+            return super()._submit()
+        except Exception:
+            self._publish_submit_progress(0, 1, _("Submission failed"), failed=True)
+            raise
+        finally:
+            self.flags.holding_submit_lock = False
+            self.unlock()
+
+    def check_if_locked(self):
+        if self.flags.holding_submit_lock:
+            return
+        super().check_if_locked()
+
+    def on_submit(self):
+        if self.flags.publish_submit_progress:
+            self._publish_submit_progress(1, 1, _("Submitted"), after_commit=True)
+
+    # -------------------
+    # QUEUED SUBMIT
+    # -------------------
+    def _should_queue_submit(self) -> bool:
+        threshold = cint(
+            frappe.conf.get("monthly_productivity_queue_submit_threshold", DEFAULT_QUEUE_SUBMIT_THRESHOLD)
+        )
+        return bool(threshold) and len(self.get("productivity") or []) >= threshold
+
+    def _publish_submit_progress(self, done, total, description=None, failed=False, after_commit=False):
+        """Publish submit progress to viewers of this document, every 100 rows, at the end and on failure."""
+        if not self.flags.publish_submit_progress or (done % 100 and done != total and not failed):
+            return
+        frappe.publish_realtime(
+            SUBMIT_PROGRESS_EVENT,
+            {
+                "progress": done,
+                "total": total,
+                "description": description or _("Validating row {0} of {1}").format(done, total),
+                "failed": cint(failed),
+            },
+            doctype=self.doctype,
+            docname=self.name,
+            after_commit=after_commit,
+        )
+
     # -------------------
     # COMMISSIONS
     # -------------------
@@ -67,11 +147,13 @@ class MonthlyProductivity(Document):
             if not inv:
                 continue
             if inv not in start_totals:
-                start_totals[inv] = flt(get_previous_execution_total(inv, self.name))
+                start_totals[inv] = flt(_get_previous_execution_total(inv, self.name))
 
         in_doc_running = dict(start_totals)
+        invoice_totals = {}
 
-        for row in rows:
+        for i, row in enumerate(rows, start=1):
+            self._publish_submit_progress(i, len(rows) + 1)
             inv = (getattr(row, "sales_invoice", "") or "").strip()
             if not inv:
                 self._ensure_sales_person_commission(row)
@@ -105,6 +187,11 @@ class MonthlyProductivity(Document):
             total_after_row = posted_so_far + prior_in_doc + current_exec
             row.delivery_status = delivery_status_from_cumulative(total_after_row)
 
+            if not flt(getattr(row, "invoice_total", 0)):
+                if inv not in invoice_totals:
+                    invoice_totals[inv] = get_net_invoice_total(inv)
+                row.invoice_total = invoice_totals[inv]
+
             if not flt(getattr(row, "actual_executed_value", 0)):
                 inv_total = flt(getattr(row, "invoice_total", 0))
                 row.actual_executed_value = flt(inv_total * (current_exec / 100.0), 2)
@@ -144,7 +231,13 @@ def delivery_status_from_cumulative(cum: float) -> str:
 
 
 @frappe.whitelist()
+@read_only(validation_critical=True)
 def get_previous_execution_total(sales_invoice, current_doc_name):
+    return _get_previous_execution_total(sales_invoice, current_doc_name)
+
+
+def _get_previous_execution_total(sales_invoice, current_doc_name):
+    """Sum of execution % already submitted for `sales_invoice`; always reads the current connection."""
     if not sales_invoice:
         return 0
 
@@ -160,3 +253,29 @@ def get_previous_execution_total(sales_invoice, current_doc_name):
         {"current_doc_name": current_doc_name, "sales_invoice": sales_invoice},
     )
     return flt(total_percentage[0][0]) if total_percentage else 0
+
+
+@frappe.whitelist()
+@read_only()
+def get_invoice_total(sales_invoice):
+    frappe.has_permission("Sales Invoice", "read", sales_invoice, throw=True)
+    return get_net_invoice_total(sales_invoice)
+
+
+def get_net_invoice_total(sales_invoice):
+    """Grand total of `sales_invoice` net of its submitted returns (credit notes)."""
+    result = frappe.db.sql(
+        """
+        SELECT si.grand_total + COALESCE((
+            SELECT SUM(ret.grand_total)
+            FROM `tabSales Invoice` ret
+            WHERE ret.return_against = si.name
+              AND ret.is_return = 1
+              AND ret.docstatus = 1
+        ), 0)
+        FROM `tabSales Invoice` si
+        WHERE si.name = %(sales_invoice)s
+        """,
+        {"sales_invoice": sales_invoice},
+    )
+    return flt(result[0][0]) if result else 0
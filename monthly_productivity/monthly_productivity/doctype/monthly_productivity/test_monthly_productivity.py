@@ -1,9 +1,114 @@
 # Copyright (c) 2025, raion digital and Contributors
 # See license.txt
 
-# import frappe
+import json
+from unittest.mock import patch
+
+import frappe
+from frappe.desk.form.save import savedocs
+from frappe.model.document import Document
 from frappe.tests.utils import FrappeTestCase
 
+from monthly_productivity.monthly_productivity.doctype.monthly_productivity.monthly_productivity import (
+	SUBMIT_PROGRESS_EVENT,
+	MonthlyProductivity,
+)
+from monthly_productivity.tests.synthetic_data import make_dataset, make_unsaved_document
+
+
+def make_doc(rows):
+	doc = frappe.get_doc(
+		{
+			"doctype": "Monthly Productivity",
+			"company": "_Test Company",
+			"report_month": "2025-01-01",
+			"productivity": [{"execution_percentage": 1} for _ in range(rows)],
+		}
+	)
+	doc.name = "_Test MP Queued Submit"
+	return doc
+
 
 class TestMonthlyProductivity(FrappeTestCase):
-	pass
+	def submit_with_threshold(self, rows, threshold):
+		doc = make_doc(rows)
+		with (
+			patch.dict(frappe.conf, {"monthly_productivity_queue_submit_threshold": threshold}),
+			patch.object(MonthlyProductivity, "queue_action") as queue_action,
+			patch.object(MonthlyProductivity, "_submit") as submit,
+		):
+			doc.submit()
+		return queue_action, submit
+
+	def test_small_document_submits_synchronously(self):
+		queue_action, submit = self.submit_with_threshold(rows=3, threshold=5)
+		submit.assert_called_once()
+		queue_action.assert_not_called()
+
+	def test_large_document_is_queued(self):
+		queue_action, submit = self.submit_with_threshold(rows=5, threshold=5)
+		queue_action.assert_called_once()
+		self.assertEqual(queue_action.call_args.args[0], "submit")
+		submit.assert_not_called()
+
+	def test_zero_threshold_disables_queueing(self):
+		queue_action, submit = self.submit_with_threshold(rows=5, threshold=0)
+		submit.assert_called_once()
+		queue_action.assert_not_called()
+
+	def test_progress_events(self):
+		doc = make_doc(250)
+		doc.flags.publish_submit_progress = True
+		with patch("frappe.publish_realtime") as publish:
+			for i in range(1, 251):
+				doc._publish_submit_progress(i, 251)
+			self.assertEqual([c.args[1]["progress"] for c in publish.call_args_list], [100, 200])
+
+			publish.reset_mock()
+			doc.on_submit()
+			publish.assert_called_once()
+			self.assertEqual(publish.call_args.args[0], SUBMIT_PROGRESS_EVENT)
+			self.assertTrue(publish.call_args.kwargs["after_commit"])
+
+	def test_queued_submit_holds_lock_and_reports_failure(self):
+		doc = make_doc(5)
+		with (
+			patch.dict(frappe.conf, {"monthly_productivity_queue_submit_threshold": 5}),
+			patch.object(Document, "_submit", side_effect=frappe.ValidationError) as submit,
+			patch.object(MonthlyProductivity, "lock") as lock,
+			patch.object(MonthlyProductivity, "unlock") as unlock,
+			patch("frappe.publish_realtime") as publish,
+		):
+			self.assertRaises(frappe.ValidationError, doc._submit)
+
+		submit.assert_called_once()
+		lock.assert_called_once()
+		unlock.assert_called_once()
+		self.assertFalse(doc.flags.holding_submit_lock)
+		self.assertEqual(publish.call_args.args[1]["failed"], 1)
+
+	def test_queued_submit_through_savedocs_returns_locked_draft(self):
+		dataset = make_dataset(
+			prefix="_MP Queued Savedocs", sales_invoices=2, documents=1, rows_per_document=1
+		)
+		doc = make_unsaved_document(dataset, rows=4)
+		doc.insert()
+		self.addCleanup(doc.unlock)
+
+		frappe.local.response = frappe._dict(docs=[])
+		with (
+			patch.dict(frappe.conf, {"monthly_productivity_queue_submit_threshold": 4}),
+			patch.object(
+				MonthlyProductivity,
+				"queue_action",
+				autospec=True,
+				side_effect=lambda self, *a, **kw: self.lock(),
+			) as queue_action,
+		):
+			savedocs(json.dumps(doc.as_dict(), default=str), "Submit")
+
+		queue_action.assert_called_once()
+		returned = frappe.response.docs[0]
+		self.assertEqual(returned["docstatus"], 0)
+		self.assertTrue(returned["__onload"]["submit_queued"])
+		self.assertEqual(frappe.db.get_value("Monthly Productivity", doc.name, "docstatus"), 0)
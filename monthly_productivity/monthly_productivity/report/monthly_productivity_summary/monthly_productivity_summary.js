@@ -107,6 +107,24 @@ frappe.query_reports["Monthly Productivity Summary"] = {
 				return { doctype: "Sales Invoice", filters: { company: company, docstatus: 1 } };
 			},
 		},
+		{
+			fieldname: "sales_person",
+			label: __("Sales Person"),
+			fieldtype: "Link",
+			options: "Sales Person",
+		},
+		{
+			fieldname: "customer",
+			label: __("Customer"),
+			fieldtype: "Link",
+			options: "Customer",
+		},
+		{
+			fieldname: "delivery_status",
+			label: __("Delivery Status"),
+			fieldtype: "Select",
+			options: ["", "Delivered", "Not Delivered", "Not Started Yet"],
+		},
 	],
 
 	formatter: function (value, row, column, data, default_formatter) {
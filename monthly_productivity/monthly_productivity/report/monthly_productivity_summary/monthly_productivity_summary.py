@@ -3,10 +3,14 @@
 
 import frappe
 from frappe import _
-from frappe.utils import date_diff
+from frappe.utils import date_diff, get_last_day
 from calendar import month_name
+from datetime import date
 
+from monthly_productivity.utils import read_only
 
+
+@read_only()
 def execute(filters=None):
     view_mode = (filters or {}).get("view_mode")
 
@@ -37,11 +41,41 @@ def execute(filters=None):
 
     else:  # Summary View (default)
         is_yearly_view = date_diff(filters.get("to_date"), filters.get("from_date")) > 365
-        columns = get_summary_columns(is_yearly_view)
+        columns = get_summary_columns(is_yearly_view, include_company_costs=not has_dimension_filters(filters))
         data, chart, report_summary = get_summary_data(filters, is_yearly_view)
         return columns, data, None, chart, report_summary
 
 
+# -----------------------------
+# Dimension filters
+# -----------------------------
+
+DIMENSION_FILTERS = ("sales_person", "customer", "delivery_status")
+
+
+def get_dimension_conditions(filters):
+    """SQL conditions on `ese` for the sales person, customer and delivery status filters."""
+    conditions = ""
+    if filters.get("sales_person"):
+        conditions += " AND ese.sales_person = %(sales_person)s"
+    if filters.get("customer"):
+        conditions += (
+            " AND ese.sales_invoice IN "
+            "(SELECT dim_si.name FROM `tabSales Invoice` dim_si WHERE dim_si.customer = %(customer)s)"
+        )
+    if filters.get("delivery_status"):
+        conditions += " AND ese.delivery_status = %(delivery_status)s"
+    return conditions
+
+
+def get_dimension_values(filters):
+    return {f: filters.get(f) for f in DIMENSION_FILTERS}
+
+
+def has_dimension_filters(filters):
+    return any(filters.get(f) for f in DIMENSION_FILTERS)
+
+
 # -----------------------------
 # Monthly Detailed View
 # -----------------------------
@@ -61,14 +95,18 @@ def get_monthly_details_columns():
 
 
 def get_monthly_details_data(filters):
+    # A date range rather than MONTH()/YEAR() so the report_month index can be used
+    month_start = date(int(filters.get("year")), int(filters.get("month")), 1)
     sql_filters = {
         "company": filters.get("company"),
-        "month": int(filters.get("month")),
-        "year": int(filters.get("year")),
+        "month_start": month_start,
+        "month_end": get_last_day(month_start),
+        **get_dimension_values(filters),
     }
+    dimension_conditions = get_dimension_conditions(filters)
 
     rows = frappe.db.sql(
-        """
+        f"""
         SELECT 
             mp.report_month AS date, 
             ese.sales_invoice, 
@@ -77,15 +115,16 @@ def get_monthly_details_data(filters):
             ese.execution_percentage,
             ese.cumulative_execution,
             COALESCE(ese.sales_person_commission, sp.commission_rate) AS sp_comm_pct,
-            COALESCE(mp.total_commission_amount, 0) AS doc_shareholder_total
+            COALESCE(mp.total_commission_amount, 0) AS doc_shareholder_total,
+            COALESCE(mp.total_commission_percentage, 0) AS doc_shareholder_pct
         FROM `tabMonthly Productivity` mp
         JOIN `tabExecution Schedule Entry` ese ON mp.name = ese.parent
         LEFT JOIN `tabSales Invoice` si ON ese.sales_invoice = si.name
         LEFT JOIN `tabSales Person` sp ON ese.sales_person = sp.name
         WHERE mp.docstatus = 1
           AND mp.company = %(company)s 
-          AND MONTH(mp.report_month) = %(month)s 
-          AND YEAR(mp.report_month) = %(year)s
+          AND mp.report_month BETWEEN %(month_start)s AND %(month_end)s
+          {dimension_conditions}
         ORDER BY mp.report_month, ese.sales_invoice
         """,
         sql_filters,
@@ -96,6 +135,9 @@ def get_monthly_details_data(filters):
         return []
 
     total_executed = sum((r.executed_value or 0) for r in rows)
+    # With dimension filters the month total no longer covers whole documents, so each
+    # row takes the document's commission percentage of its own executed value instead.
+    per_row_shareholder = has_dimension_filters(filters)
 
     # Allocate the document-level shareholder total proportionally by executed value
     for r in rows:
@@ -103,6 +145,10 @@ def get_monthly_details_data(filters):
         sp_pct = float(r.sp_comm_pct or 0)
         r["sp_commission"] = exe * (sp_pct / 100.0)
 
+        if per_row_shareholder:
+            r["shareholder_commission"] = exe * (float(r.doc_shareholder_pct or 0) / 100.0)
+            continue
+
         share = (exe / total_executed) if total_executed else 0
         # distribute mp.total_commission_amount proportionally
         r["shareholder_commission"] = (r.doc_shareholder_total or 0) * share
@@ -124,8 +170,11 @@ def get_invoice_progress_columns():
 
 
 def get_invoice_progress_data(filters):
+    sql_filters = {"sales_invoice": filters.get("sales_invoice"), **get_dimension_values(filters)}
+    dimension_conditions = get_dimension_conditions(filters)
+
     progress_entries = frappe.db.sql(
-        """
+        f"""
         SELECT 
             mp.name AS monthly_productivity_doc,
             mp.report_month,
@@ -135,9 +184,10 @@ def get_invoice_progress_data(filters):
         JOIN `tabMonthly Productivity` AS mp ON ese.parent = mp.name
         WHERE ese.sales_invoice = %(sales_invoice)s
           AND mp.docstatus = 1
+          {dimension_conditions}
         ORDER BY mp.report_month ASC
         """,
-        filters,
+        sql_filters,
         as_dict=1,
     )
 
@@ -171,9 +221,14 @@ def get_invoice_progress_chart(data):
 # Summary View
 # -----------------------------
 
-def get_summary_columns(is_yearly_view):
+# Company-wide figures that cannot be attributed to a sales person, customer or
+# delivery status slice; they are left out when a dimension filter is set.
+COMPANY_COST_FIELDS = ("total_purchases", "other_expenses", "profit_loss")
+
+
+def get_summary_columns(is_yearly_view, include_company_costs=True):
     period_label = _("Year") if is_yearly_view else _("Month")
-    return [
+    columns = [
         {"label": period_label, "fieldname": "period", "fieldtype": "Data", "width": 130},
         {"label": _("Executed Value"), "fieldname": "executed_value", "fieldtype": "Currency", "width": 140},
         {"label": _("Total Purchases"), "fieldname": "total_purchases", "fieldtype": "Currency", "width": 140},
@@ -182,6 +237,9 @@ def get_summary_columns(is_yearly_view):
         {"label": _("Shareholder Commission"), "fieldname": "shareholder_commission", "fieldtype": "Currency", "width": 170},
         {"label": _("Profit or Loss"), "fieldname": "profit_loss", "fieldtype": "Currency", "width": 150},
     ]
+    if include_company_costs:
+        return columns
+    return [c for c in columns if c["fieldname"] not in COMPANY_COST_FIELDS]
 
 
 def get_summary_data(filters, is_yearly_view):
@@ -190,7 +248,10 @@ def get_summary_data(filters, is_yearly_view):
         "company": filters.get("company"),
         "from_date": filters.get("from_date"),
         "to_date": filters.get("to_date"),
+        **get_dimension_values(filters),
     }
+    dimension_conditions = get_dimension_conditions(filters)
+    filter_by_dimension = has_dimension_filters(filters)
 
     # 1) Executed value + weighted SP% per period
     exec_and_sp_pct = frappe.db.sql(
@@ -201,21 +262,23 @@ def get_summary_data(filters, is_yearly_view):
             CASE WHEN SUM(ese.actual_executed_value) = 0 THEN 0
                  ELSE SUM(ese.actual_executed_value * COALESCE(ese.sales_person_commission, sp.commission_rate, 0))
                       / SUM(ese.actual_executed_value)
-            END AS avg_sp_comm_pct
+            END AS avg_sp_comm_pct,
+            SUM(ese.actual_executed_value * COALESCE(mp.total_commission_percentage, 0) / 100) AS sh_commission_share
         FROM `tabMonthly Productivity` mp
         JOIN `tabExecution Schedule Entry` ese ON mp.name = ese.parent
         LEFT JOIN `tabSales Person` sp ON ese.sales_person = sp.name
         WHERE mp.docstatus = 1
           AND mp.company = %(company)s
           AND mp.report_month BETWEEN %(from_date)s AND %(to_date)s
+          {dimension_conditions}
         GROUP BY period_group
         """,
         sql_filters,
         as_dict=1,
     )
 
-    # 2) Purchases per period
-    purchases_data = frappe.db.sql(
+    # 2) Purchases per period (company-wide, skipped for dimension slices)
+    purchases_data = [] if filter_by_dimension else frappe.db.sql(
         f"""
         SELECT DATE_FORMAT(pi.posting_date, {date_format}) AS period_group,
                SUM(pi.base_grand_total) AS total_purchases
@@ -229,8 +292,8 @@ def get_summary_data(filters, is_yearly_view):
         as_dict=1,
     )
 
-    # 3) Other expenses per period
-    other_expenses_data = frappe.db.sql(
+    # 3) Other expenses per period (company-wide, skipped for dimension slices)
+    other_expenses_data = [] if filter_by_dimension else frappe.db.sql(
         f"""
         SELECT DATE_FORMAT(je.posting_date, {date_format}) AS period_group,
                SUM(jea.debit_in_account_currency) AS total_other_expenses
@@ -246,8 +309,10 @@ def get_summary_data(filters, is_yearly_view):
         as_dict=1,
     )
 
-    # 4) NEW: Sum parent-level shareholder commission amount per period
-    shareholder_sums = frappe.db.sql(
+    # 4) NEW: Sum parent-level shareholder commission amount per period.
+    # With dimension filters only part of each document is included, so the
+    # proportional share computed in query 1 is used instead.
+    shareholder_sums = [] if filter_by_dimension else frappe.db.sql(
         f"""
         SELECT DATE_FORMAT(mp.report_month, {date_format}) AS period_group,
                SUM(COALESCE(mp.total_commission_amount, 0)) AS sh_commission_sum
@@ -269,7 +334,7 @@ def get_summary_data(filters, is_yearly_view):
             avg_sp_comm_pct=float(row.avg_sp_comm_pct or 0),
             total_purchases=0,
             other_expenses=0,
-            shareholder_commission=0.0,
+            shareholder_commission=float(row.sh_commission_share or 0) if filter_by_dimension else 0.0,
         )
 
     for row in purchases_data:
@@ -326,24 +391,25 @@ def get_summary_data(filters, is_yearly_view):
         year, month_num = (period, "01") if is_yearly_view else period.split("-")
         formatted_period = year if is_yearly_view else f"{_(month_name[int(month_num)])} {year}"
 
-        report_data.append(
-            {
-                "period": formatted_period,
-                "executed_value": executed,
-                "total_purchases": purchases,
-                "other_expenses": other_exp,
-                "sp_commission": sp_commission_amt,
-                "shareholder_commission": shareholder_commission_amt,
-                "profit_loss": final_profit,
-            }
-        )
-
-    chart = get_chart_data(report_data)
-    summary = get_report_summary(report_data)
+        row = {
+            "period": formatted_period,
+            "executed_value": executed,
+            "total_purchases": purchases,
+            "other_expenses": other_exp,
+            "sp_commission": sp_commission_amt,
+            "shareholder_commission": shareholder_commission_amt,
+            "profit_loss": final_profit,
+        }
+        if filter_by_dimension:
+            row.update(dict.fromkeys(COMPANY_COST_FIELDS))
+        report_data.append(row)
+
+    chart = get_chart_data(report_data, include_profit=not filter_by_dimension)
+    summary = get_report_summary(report_data, include_profit=not filter_by_dimension)
     return report_data, chart, summary
 
 
-def get_chart_data(data):
+def get_chart_data(data, include_profit=True):
     if not data:
         return None
     labels = [row["period"] for row in data if "Total" not in row.get("period", "")]
@@ -353,21 +419,27 @@ def get_chart_data(data):
         {"name": _("Sales Person Commission"), "values": [r["sp_commission"] for r in data if "Total" not in r.get("period", "")]},
         {"name": _("Shareholder Commission"), "values": [r["shareholder_commission"] for r in data if "Total" not in r.get("period", "")]},
     ]
+    if not include_profit:
+        datasets = [d for d in datasets if d["name"] != _("Profit or Loss")]
     return {"data": {"labels": labels, "datasets": datasets}, "type": "bar", "height": 300}
 
 
-def get_report_summary(data):
+def get_report_summary(data, include_profit=True):
     if not data:
         return None
     rows_to_sum = [row for row in data if "Total" not in row.get("period", "")]
     total_executed = sum(r.get("executed_value", 0) for r in rows_to_sum)
     total_sp_comm = sum(r.get("sp_commission", 0) for r in rows_to_sum)
     total_sh_comm = sum(r.get("shareholder_commission", 0) for r in rows_to_sum)
-    total_profit_after_commission = sum(r.get("profit_loss", 0) for r in rows_to_sum)
 
-    return [
+    summary = [
         {"value": total_executed, "label": _("Total Executed Value"), "datatype": "Currency", "indicator": "Green" if total_executed >= 0 else "Red"},
         {"value": total_sp_comm, "label": _("Total Sales Person Commission"), "datatype": "Currency", "indicator": "Green" if total_sp_comm >= 0 else "Red"},
         {"value": total_sh_comm, "label": _("Total Shareholder Commission"), "datatype": "Currency", "indicator": "Green" if total_sh_comm >= 0 else "Red"},
-        {"value": total_profit_after_commission, "label": _("Total Profit / Loss"), "datatype": "Currency", "indicator": "Green" if total_profit_after_commission >= 0 else "Red"},
     ]
+    if include_profit:
+        total_profit_after_commission = sum(r.get("profit_loss") or 0 for r in rows_to_sum)
+        summary.append(
+            {"value": total_profit_after_commission, "label": _("Total Profit / Loss"), "datatype": "Currency", "indicator": "Green" if total_profit_after_commission >= 0 else "Red"}
+        )
+    return summary
@@ -0,0 +1,109 @@
+# Copyright (c) 2025, raion digital and Contributors
+# See license.txt
+
+import frappe
+from frappe.tests.utils import FrappeTestCase
+
+from monthly_productivity.monthly_productivity.report.monthly_productivity_summary.monthly_productivity_summary import (
+	execute,
+)
+from monthly_productivity.tests.synthetic_data import make_dataset
+
+
+class TestMonthlyProductivitySummary(FrappeTestCase):
+	@classmethod
+	def setUpClass(cls):
+		super().setUpClass()
+		cls.dataset = make_dataset(prefix="_MP Summary", sales_invoices=10, documents=3, rows_per_document=6)
+
+	def summary_filters(self, **kwargs):
+		return frappe._dict(
+			view_mode="Summary View",
+			company=self.dataset.company,
+			from_date=self.dataset.from_date,
+			to_date=self.dataset.to_date,
+			**kwargs,
+		)
+
+	def test_dimension_filter_hides_company_costs(self):
+		columns, data, _message, chart, summary = execute(
+			self.summary_filters(sales_person=self.dataset.sales_persons[0])
+		)
+		fieldnames = {c["fieldname"] for c in columns}
+		self.assertFalse(fieldnames & {"total_purchases", "other_expenses", "profit_loss"})
+		self.assertTrue(all(row["profit_loss"] is None for row in data))
+		self.assertNotIn("Total Profit / Loss", [card["label"] for card in summary])
+
+	def test_unfiltered_summary_keeps_profit_or_loss(self):
+		columns, _data, _message, _chart, summary = execute(self.summary_filters())
+		self.assertIn("profit_loss", [c["fieldname"] for c in columns])
+		self.assertIn("Total Profit / Loss", [card["label"] for card in summary])
+
+	def test_monthly_detailed_view_covers_whole_month(self):
+		_columns, data, *_rest = execute(
+			frappe._dict(view_mode="Monthly Detailed View", company=self.dataset.company, month=1, year=2025)
+		)
+		self.assertEqual(len(data), 6)
+
+	def synthetic_rows(self, **filters):
+		return frappe.get_all(
+			"Execution Schedule Entry",
+			filters={"parent": ["in", self.dataset.documents], **filters},
+			fields=[
+				"parent",
+				"sales_invoice",
+				"customer",
+				"sales_person",
+				"delivery_status",
+				"actual_executed_value",
+			],
+		)
+
+	def summary_executed_value(self, **filters):
+		_columns, data, *_rest = execute(self.summary_filters(**filters))
+		return sum(row["executed_value"] or 0 for row in data)
+
+	def test_summary_view_is_narrowed_by_each_dimension(self):
+		rows = self.synthetic_rows()
+		sample = rows[0]
+		for fieldname in ("sales_person", "customer", "delivery_status"):
+			with self.subTest(fieldname=fieldname):
+				expected = sum(r.actual_executed_value for r in rows if r[fieldname] == sample[fieldname])
+				self.assertAlmostEqual(
+					self.summary_executed_value(**{fieldname: sample[fieldname]}), expected, places=2
+				)
+				self.assertLessEqual(expected, self.summary_executed_value())
+
+	def test_monthly_detailed_view_is_narrowed_by_each_dimension(self):
+		first_document = self.dataset.documents[0]
+		rows = self.synthetic_rows(parent=first_document)
+		sample = rows[0]
+		for fieldname in ("sales_person", "customer", "delivery_status"):
+			with self.subTest(fieldname=fieldname):
+				_columns, data, *_rest = execute(
+					frappe._dict(
+						view_mode="Monthly Detailed View",
+						company=self.dataset.company,
+						month=1,
+						year=2025,
+						**{fieldname: sample[fieldname]},
+					)
+				)
+				expected = sorted(r.sales_invoice for r in rows if r[fieldname] == sample[fieldname])
+				self.assertEqual(sorted(row.sales_invoice for row in data), expected)
+
+	def test_invoice_progress_view_is_narrowed_by_each_dimension(self):
+		sample = self.synthetic_rows()[0]
+		rows = self.synthetic_rows(sales_invoice=sample.sales_invoice)
+		for fieldname in ("sales_person", "customer", "delivery_status"):
+			with self.subTest(fieldname=fieldname):
+				_columns, data, *_rest = execute(
+					frappe._dict(
+						view_mode="Detailed Invoice View",
+						company=self.dataset.company,
+						sales_invoice=sample.sales_invoice,
+						**{fieldname: sample[fieldname]},
+					)
+				)
+				expected = sorted(r.parent for r in rows if r[fieldname] == sample[fieldname])
+				self.assertEqual(sorted(row["monthly_productivity_doc"] for row in data), expected)
@@ -0,0 +1,291 @@
+# Copyright (c) 2025, raion digital and Contributors
+# See license.txt
+
+"""Seeded synthetic data for tests and benchmarks.
+
+Masters, invoices and submitted Monthly Productivity documents are written with
+``frappe.db.bulk_insert`` so that large datasets can be produced quickly inside a
+test transaction. Only the columns read by this app are populated; the rows are
+not meant to pass ERPNext's own validations.
+"""
+
+import hashlib
+import random
+
+import frappe
+from frappe.utils import add_months, flt, getdate, now
+
+from monthly_productivity.monthly_productivity.doctype.monthly_productivity.monthly_productivity import (
+	delivery_status_from_cumulative,
+)
+
+DEFAULT_SEED = 2025
+BASE_DATE = "2025-01-01"
+
+# Share of each invoice consumed by the generated submitted history. The rest is
+# left for documents built with `make_unsaved_document` so they validate cleanly.
+HISTORY_EXECUTION_CAP = 60.0
+
+
+def make_dataset(
+	prefix="_MP Bench",
+	seed=DEFAULT_SEED,
+	sales_persons=5,
+	customers=10,
+	shareholders=3,
+	sales_invoices=50,
+	purchase_invoices=20,
+	documents=12,
+	rows_per_document=10,
+):
+	"""Create one company with the given number of records and return their names.
+
+	`documents` submitted Monthly Productivity documents are spread over consecutive
+	months starting at `BASE_DATE`, each with `rows_per_document` execution rows.
+	"""
+	rng = random.Random(seed)
+	ts = now()
+	company = f"{prefix} Company"
+	abbr = "MP" + hashlib.sha1(f"{prefix}:{seed}".encode()).hexdigest()[:8].upper()
+
+	_insert("Company", ["company_name", "abbr", "default_currency"], [[company, company, abbr, "USD"]], ts)
+
+	sp_names = [f"{prefix} Sales Person {i:04d}" for i in range(sales_persons)]
+	_insert(
+		"Sales Person",
+		["sales_person_name", "commission_rate", "is_group", "enabled"],
+		[[n, n, rng.choice((1, 2, 2.5, 3, 5)), 0, 1] for n in sp_names],
+		ts,
+	)
+
+	customer_names = [f"{prefix} Customer {i:04d}" for i in range(customers)]
+	_insert("Customer", ["customer_name"], [[n, n] for n in customer_names], ts)
+
+	sh_names = [f"{prefix} Shareholder {i:04d}" for i in range(shareholders)]
+	_insert(
+		"Shareholder",
+		["title", "company", "commission_percentage"],
+		[[n, n, company, rng.choice((1, 2, 5, 10))] for n in sh_names],
+		ts,
+	)
+
+	months = max(documents, 1)
+	invoices = []
+	si_rows = []
+	for i in range(sales_invoices):
+		name = f"{prefix}-SINV-{i:06d}"
+		customer = rng.choice(customer_names)
+		total = flt(rng.uniform(1_000, 100_000), 2)
+		posting_date = add_months(BASE_DATE, rng.randrange(months))
+		invoices.append(frappe._dict(name=name, customer=customer, grand_total=total))
+		si_rows.append([name, company, customer, customer, posting_date, total, total, 1])
+	_insert(
+		"Sales Invoice",
+		[
+			"company",
+			"customer",
+			"customer_name",
+			"posting_date",
+			"grand_total",
+			"base_grand_total",
+			"docstatus",
+		],
+		si_rows,
+		ts,
+	)
+
+	pi_rows = []
+	for i in range(purchase_invoices):
+		total = flt(rng.uniform(500, 50_000), 2)
+		pi_rows.append(
+			[f"{prefix}-PINV-{i:06d}", company, add_months(BASE_DATE, rng.randrange(months)), total, 1]
+		)
+	_insert("Purchase Invoice", ["company", "posting_date", "base_grand_total", "docstatus"], pi_rows, ts)
+
+	executed = {inv.name: 0.0 for inv in invoices}
+	doc_names = []
+	for d in range(documents if invoices else 0):
+		doc_names.append(
+			_insert_submitted_document(
+				f"{prefix}-MP-{d:06d}",
+				company,
+				getdate(add_months(BASE_DATE, d)),
+				rng,
+				invoices,
+				sp_names,
+				sh_names,
+				executed,
+				rows_per_document,
+				ts,
+			)
+		)
+
+	return frappe._dict(
+		seed=seed,
+		company=company,
+		sales_persons=sp_names,
+		customers=customer_names,
+		shareholders=sh_names,
+		sales_invoices=[inv.name for inv in invoices],
+		invoices=invoices,
+		documents=doc_names,
+		executed=executed,
+		from_date=BASE_DATE,
+		to_date=add_months(BASE_DATE, months),
+	)
+
+
+def make_unsaved_document(dataset, rows, seed=DEFAULT_SEED):
+	"""Return an unsaved Monthly Productivity for `dataset` with `rows` execution rows.
+
+	Execution percentages only use the share of each invoice not consumed by the
+	submitted history, so the document passes validation.
+	"""
+	rng = random.Random(seed)
+	invoices = dataset.invoices
+	per_invoice = {}
+	for i in range(rows):
+		inv = invoices[i % len(invoices)]
+		per_invoice[inv.name] = per_invoice.get(inv.name, 0) + 1
+
+	productivity = []
+	for i in range(rows):
+		inv = invoices[i % len(invoices)]
+		remaining = 100.0 - dataset.executed[inv.name]
+		productivity.append(
+			{
+				"sales_invoice": inv.name,
+				"customer": inv.customer,
+				"sales_person": rng.choice(dataset.sales_persons),
+				"sales_person_commission": rng.choice((1, 2, 3)),
+				"execution_percentage": max(flt(remaining / per_invoice[inv.name] - 0.01, 2), 0),
+				"invoice_total": inv.grand_total,
+			}
+		)
+
+	return frappe.get_doc(
+		{
+			"doctype": "Monthly Productivity",
+			"company": dataset.company,
+			"report_month": dataset.to_date,
+			"productivity": productivity,
+			"commission_breakdown": [{"shareholder": sh} for sh in dataset.shareholders],
+		}
+	)
+
+
+def _insert_submitted_document(
+	name, company, report_month, rng, invoices, sp_names, sh_names, executed, rows, ts
+):
+	base = 0.0
+	child_rows = []
+	for idx in range(1, rows + 1):
+		inv = rng.choice(invoices)
+		pct = min(flt(rng.uniform(1, 15), 2), flt(HISTORY_EXECUTION_CAP - executed[inv.name], 2))
+		pct = max(pct, 0)
+		executed[inv.name] += pct
+		value = flt(inv.grand_total * pct / 100.0, 2)
+		base += value
+		child_rows.append(
+			[
+				frappe.generate_hash(length=10),
+				name,
+				"Monthly Productivity",
+				"productivity",
+				idx,
+				1,
+				inv.name,
+				inv.customer,
+				pct,
+				rng.choice(sp_names),
+				rng.choice((1, 2, 3)),
+				flt(executed[inv.name], 2),
+				inv.grand_total,
+				value,
+				delivery_status_from_cumulative(executed[inv.name]),
+			]
+		)
+
+	commission_rows = []
+	total_pct = total_amt = 0.0
+	for idx, sh in enumerate(sh_names, start=1):
+		pct = rng.choice((1, 2, 5))
+		amt = round(base * pct / 100.0, 2)
+		total_pct += pct
+		total_amt += amt
+		commission_rows.append(
+			[
+				frappe.generate_hash(length=10),
+				name,
+				"Monthly Productivity",
+				"commission_breakdown",
+				idx,
+				1,
+				sh,
+				pct,
+				amt,
+			]
+		)
+
+	_insert(
+		"Monthly Productivity",
+		[
+			"naming_series",
+			"company",
+			"report_month",
+			"total_commission_percentage",
+			"total_commission_amount",
+			"docstatus",
+		],
+		[[name, "MON-PROD-.MM.-.YYYY.-", company, report_month, flt(total_pct, 2), flt(total_amt, 2), 1]],
+		ts,
+	)
+	_insert(
+		"Execution Schedule Entry",
+		[
+			"parent",
+			"parenttype",
+			"parentfield",
+			"idx",
+			"docstatus",
+			"sales_invoice",
+			"customer",
+			"execution_percentage",
+			"sales_person",
+			"sales_person_commission",
+			"cumulative_execution",
+			"invoice_total",
+			"actual_executed_value",
+			"delivery_status",
+		],
+		child_rows,
+		ts,
+	)
+	_insert(
+		"Monthly Productivity Commission Row",
+		[
+			"parent",
+			"parenttype",
+			"parentfield",
+			"idx",
+			"docstatus",
+			"shareholder",
+			"commission_percentage",
+			"commission_amount",
+		],
+		commission_rows,
+		ts,
+	)
+	return name
+
+
+def _insert(doctype, fields, values, ts):
+	"""Bulk insert `values` (each starting with `name`) with standard audit columns."""
+	if not values:
+		return
+	user = frappe.session.user
+	frappe.db.bulk_insert(
+		doctype,
+		["name", *fields, "creation", "modified", "owner", "modified_by"],
+		[[*row, ts, ts, user, user] for row in values],
+	)
@@ -0,0 +1,203 @@
+# Copyright (c) 2025, raion digital and Contributors
+# See license.txt
+
+"""Timing and query-count benchmarks for validation and the summary report.
+
+Skipped unless ``MP_BENCHMARK=1`` or ``MP_BENCHMARK_SIZES`` is set, e.g.::
+
+	MP_BENCHMARK_SIZES=10,100,1000 MP_BENCHMARK_OUTPUT=/tmp/mp-bench.json \
+		bench --site test_site run-tests --module monthly_productivity.tests.test_benchmarks
+
+Sizes are execution rows per operation (comma separated). When
+``MP_BENCHMARK_OUTPUT`` is set, results are written there as JSON keyed by
+``<operation>:<size>`` so two runs can be diffed. Replica routing is turned off
+while measuring so every query is counted on one connection.
+"""
+
+import json
+import os
+import statistics
+import time
+import unittest
+from contextlib import contextmanager
+from unittest.mock import patch
+
+import frappe
+from frappe.tests.utils import FrappeTestCase
+
+from monthly_productivity.monthly_productivity.report.monthly_productivity_summary import (
+	monthly_productivity_summary as summary_report,
+)
+from monthly_productivity.tests.synthetic_data import make_dataset, make_unsaved_document
+
+DEFAULT_SIZES = (10, 100, 1000)
+REPEATS = int(os.environ.get("MP_BENCHMARK_REPEATS") or 3)
+
+# Maximum number of queries per operation. Validation issues one cumulative
+# lookup per distinct invoice and one Shareholder lookup per commission row
+# (`fetch_from` does not run when `validate` is called directly); the report
+# views are fixed.
+QUERY_BUDGETS = {
+	"validate": lambda dataset, doc: len({r.sales_invoice for r in doc.productivity})
+	+ len(doc.commission_breakdown),
+	"summary_view": lambda dataset, doc: 4,
+	"summary_view_by_sales_person": lambda dataset, doc: 1,
+	"monthly_detailed_view": lambda dataset, doc: 1,
+	"invoice_progress_view": lambda dataset, doc: 1,
+}
+
+
+def get_sizes():
+	sizes = os.environ.get("MP_BENCHMARK_SIZES")
+	if not sizes:
+		return DEFAULT_SIZES
+	return tuple(int(s) for s in sizes.split(",") if s.strip())
+
+
+def benchmarks_enabled():
+	return bool(os.environ.get("MP_BENCHMARK") or os.environ.get("MP_BENCHMARK_SIZES"))
+
+
+@contextmanager
+def count_queries():
+	"""Yield a list that collects every query sent through `frappe.db.sql`.
+
+	`read_from_replica` is disabled for the duration, otherwise report queries would
+	run on the replica connection and escape the count.
+	"""
+	queries = []
+	sql = frappe.db.sql
+
+	def _sql(query, *args, **kwargs):
+		queries.append(str(query))
+		return sql(query, *args, **kwargs)
+
+	with patch.dict(frappe.conf, {"read_from_replica": 0}), patch.object(frappe.db, "sql", _sql):
+		yield queries
+
+
+def make_named_document(dataset, rows):
+	"""Unsaved document with a name, so the cumulative lookups exclude it instead of
+	comparing against NULL and matching nothing."""
+	doc = make_unsaved_document(dataset, rows=rows)
+	doc.name = f"{dataset.company} Draft"
+	return doc
+
+
+@unittest.skipUnless(benchmarks_enabled(), "set MP_BENCHMARK=1 or MP_BENCHMARK_SIZES to run benchmarks")
+class TestMonthlyProductivityBenchmarks(FrappeTestCase):
+	@classmethod
+	def setUpClass(cls):
+		super().setUpClass()
+		cls.results = []
+		cls.datasets = {}
+		for size in get_sizes():
+			cls.datasets[size] = make_dataset(
+				prefix=f"_MP Bench {size}",
+				sales_invoices=max(size // 4, 1),
+				purchase_invoices=max(size // 10, 1),
+				documents=12,
+				rows_per_document=max(size // 12, 1),
+			)
+
+	@classmethod
+	def tearDownClass(cls):
+		write_results(cls.results)
+		super().tearDownClass()
+
+	def test_validate(self):
+		for size, dataset in self.datasets.items():
+			self.run_benchmark(
+				"validate",
+				size,
+				dataset,
+				lambda doc: doc.validate(),
+				make_doc=lambda: make_named_document(dataset, size),
+			)
+
+	def test_summary_view(self):
+		for size, dataset in self.datasets.items():
+			filters = frappe._dict(
+				view_mode="Summary View",
+				company=dataset.company,
+				from_date=dataset.from_date,
+				to_date=dataset.to_date,
+			)
+			self.run_benchmark("summary_view", size, dataset, lambda doc: summary_report.execute(filters))
+
+	def test_summary_view_by_sales_person(self):
+		for size, dataset in self.datasets.items():
+			filters = frappe._dict(
+				view_mode="Summary View",
+				company=dataset.company,
+				from_date=dataset.from_date,
+				to_date=dataset.to_date,
+				sales_person=dataset.sales_persons[0],
+			)
+			self.run_benchmark(
+				"summary_view_by_sales_person", size, dataset, lambda doc: summary_report.execute(filters)
+			)
+
+	def test_monthly_detailed_view(self):
+		for size, dataset in self.datasets.items():
+			filters = frappe._dict(
+				view_mode="Monthly Detailed View", company=dataset.company, month=1, year=2025
+			)
+			self.run_benchmark(
+				"monthly_detailed_view", size, dataset, lambda doc: summary_report.execute(filters)
+			)
+
+	def test_invoice_progress_view(self):
+		for size, dataset in self.datasets.items():
+			filters = frappe._dict(
+				view_mode="Detailed Invoice View",
+				company=dataset.company,
+				sales_invoice=dataset.sales_invoices[0],
+			)
+			self.run_benchmark(
+				"invoice_progress_view", size, dataset, lambda doc: summary_report.execute(filters)
+			)
+
+	def run_benchmark(self, operation, size, dataset, fn, make_doc=None):
+		"""Time `fn(doc)` over `REPEATS` runs, building a fresh `doc` with `make_doc` for each."""
+		timings = []
+		query_count = 0
+		doc = None
+		for _ in range(REPEATS):
+			doc = make_doc() if make_doc else None
+			with count_queries() as queries:
+				start = time.perf_counter()
+				fn(doc)
+				timings.append(time.perf_counter() - start)
+			query_count = max(query_count, len(queries))
+
+		budget = QUERY_BUDGETS[operation](dataset, doc)
+		self.results.append(
+			{
+				"key": f"{operation}:{size}",
+				"operation": operation,
+				"size": size,
+				"repeats": REPEATS,
+				"min_s": min(timings),
+				"median_s": statistics.median(timings),
+				"max_s": max(timings),
+				"queries": query_count,
+				"query_budget": budget,
+			}
+		)
+		self.assertLessEqual(
+			query_count, budget, f"{operation} at size {size} ran {query_count} queries (budget {budget})"
+		)
+
+
+def write_results(results):
+	path = os.environ.get("MP_BENCHMARK_OUTPUT")
+	if not path:
+		return
+	payload = {
+		"site": frappe.local.site,
+		"timestamp": frappe.utils.now(),
+		"results": {r["key"]: r for r in sorted(results, key=lambda r: r["key"])},
+	}
+	with open(path, "w") as f:
+		json.dump(payload, f, indent=1, default=str)
@@ -0,0 +1,101 @@
+# Copyright (c) 2025, raion digital and Contributors
+# See license.txt
+
+from unittest.mock import patch
+
+import frappe
+from frappe.tests.utils import FrappeTestCase
+from frappe.utils import add_to_date, now, now_datetime
+
+from monthly_productivity import api
+from monthly_productivity.api import get_execution_fact_changes, get_upper_bound
+from monthly_productivity.tests.synthetic_data import make_dataset
+
+
+class TestExecutionFactChangeFeed(FrappeTestCase):
+	@classmethod
+	def setUpClass(cls):
+		super().setUpClass()
+		cls.dataset = make_dataset(
+			prefix="_MP Change Feed", sales_invoices=5, documents=3, rows_per_document=4
+		)
+
+	def setUp(self):
+		# Generated rows are stamped "now"; include them despite the safety delay
+		patcher = patch.object(api, "get_upper_bound", return_value=add_to_date(now_datetime(), hours=1))
+		patcher.start()
+		self.addCleanup(patcher.stop)
+
+	def fetch_all(self, cursor=None):
+		facts = []
+		while True:
+			page = get_execution_fact_changes(cursor=cursor, page_length=5)
+			facts.extend(page["facts"])
+			cursor = page["next_cursor"]
+			if not page["has_more"]:
+				return facts, cursor
+
+	def test_pages_cover_every_row_once(self):
+		facts, _cursor = self.fetch_all()
+		names = [f["name"] for f in facts if f["parent"] in self.dataset.documents]
+		self.assertEqual(len(names), 12)
+		self.assertEqual(len(set(names)), 12)
+
+	def test_cancellation_is_reported_as_tombstone(self):
+		_facts, cursor = self.fetch_all()
+		cancelled = self.dataset.documents[0]
+		modified = add_to_date(now(), seconds=1)
+		frappe.db.sql(
+			"UPDATE `tabExecution Schedule Entry` SET docstatus = 2, modified = %s WHERE parent = %s",
+			(modified, cancelled),
+		)
+		frappe.db.sql("UPDATE `tabMonthly Productivity` SET docstatus = 2 WHERE name = %s", cancelled)
+
+		facts, _cursor = self.fetch_all(cursor)
+		self.assertEqual(len(facts), 4)
+		self.assertTrue(all(f["deleted"] and f["parent"] == cancelled for f in facts))
+
+	def test_drafts_are_not_exported(self):
+		draft = self.dataset.documents[1]
+		frappe.db.sql("UPDATE `tabMonthly Productivity` SET docstatus = 0 WHERE name = %s", draft)
+		self.addCleanup(
+			frappe.db.sql, "UPDATE `tabMonthly Productivity` SET docstatus = 1 WHERE name = %s", draft
+		)
+		facts, _cursor = self.fetch_all()
+		self.assertNotIn(draft, {f["parent"] for f in facts})
+
+	def test_recent_rows_are_held_back(self):
+		with patch.object(api, "get_upper_bound", return_value=add_to_date(now_datetime(), hours=-1)):
+			facts, _cursor = self.fetch_all()
+		self.assertFalse({f["parent"] for f in facts} & set(self.dataset.documents))
+
+	def test_deleted_documents_are_reported_as_tombstones(self):
+		dataset = make_dataset(
+			prefix="_MP Change Feed Delete", sales_invoices=2, documents=1, rows_per_document=3
+		)
+		_facts, cursor = self.fetch_all()
+		deleted = dataset.documents[0]
+		doc = frappe.get_doc("Monthly Productivity", deleted)
+		doc.docstatus = 2
+		row_names = {row.name for row in doc.productivity}
+
+		frappe.get_doc(
+			{
+				"doctype": "Deleted Document",
+				"deleted_doctype": "Monthly Productivity",
+				"deleted_name": deleted,
+				"data": frappe.as_json(doc.as_dict()),
+			}
+		).insert(ignore_permissions=True)
+		frappe.db.delete("Execution Schedule Entry", {"parent": deleted})
+		frappe.db.delete("Monthly Productivity", {"name": deleted})
+
+		facts, _cursor = self.fetch_all(cursor)
+		self.assertEqual({f["name"] for f in facts}, row_names)
+		self.assertTrue(all(f["deleted"] and f["parent"] == deleted for f in facts))
+
+	def test_delay_cannot_be_shorter_than_queued_submit_timeout(self):
+		with patch.dict(frappe.conf, {"monthly_productivity_change_feed_delay": 60}):
+			self.assertLessEqual(
+				get_upper_bound(), add_to_date(now_datetime(), seconds=-api.MIN_CHANGE_FEED_DELAY)
+			)
@@ -0,0 +1,62 @@
+# Copyright (c) 2025, raion digital and Contributors
+# See license.txt
+
+from unittest.mock import patch
+
+import frappe
+from frappe.tests.utils import FrappeTestCase
+
+from monthly_productivity import kpi
+
+
+class TestProductivityKPIs(FrappeTestCase):
+	def setUp(self):
+		frappe.cache.delete_keys(kpi.KPI_CACHE_PREFIX)
+
+	def tearDown(self):
+		frappe.cache.delete_keys(kpi.KPI_CACHE_PREFIX)
+		frappe.set_user("Administrator")
+
+	def test_kpis_are_computed_once_per_company_and_window(self):
+		rows = [
+			{
+				"period": "January 2025",
+				"executed_value": 100,
+				"profit_loss": 40,
+				"sp_commission": 5,
+				"shareholder_commission": 10,
+			}
+		]
+		with patch.object(kpi, "_compute_kpi_data", return_value=rows) as compute:
+			filters = {"company": "_Test Company", "timespan": "Last Year"}
+			self.assertEqual(kpi.get_executed_value(filters)["value"], 100)
+			self.assertEqual(kpi.get_total_commission(filters)["value"], 15)
+			self.assertEqual(kpi.get_kpi_chart(filters)["labels"], ["January 2025"])
+			self.assertEqual(compute.call_count, 1)
+
+			kpi.get_profit_loss({"company": "_Test Company 1", "timespan": "Last Year"})
+			self.assertEqual(compute.call_count, 2)
+
+	def test_cache_is_keyed_by_language(self):
+		with patch.object(kpi, "_compute_kpi_data", return_value=[]) as compute:
+			filters = {"company": "_Test Company", "timespan": "Last Year"}
+			kpi.get_kpi_data(filters)
+			with patch.object(frappe.local, "lang", "ar"):
+				kpi.get_kpi_data(filters)
+			self.assertEqual(compute.call_count, 2)
+
+	def test_kpis_require_read_permission(self):
+		frappe.set_user("Guest")
+		self.assertRaises(frappe.PermissionError, kpi.get_executed_value, {"company": "_Test Company"})
+
+	def test_kpis_respect_company_permission(self):
+		with (
+			patch.object(kpi, "_compute_kpi_data", return_value=[]) as compute,
+			patch(
+				"frappe.has_permission",
+				side_effect=lambda doctype, *a, **kw: doctype != "Company"
+				or frappe.throw("", frappe.PermissionError),
+			),
+		):
+			self.assertRaises(frappe.PermissionError, kpi.get_kpi_data, {"company": "_Test Company"})
+		compute.assert_not_called()
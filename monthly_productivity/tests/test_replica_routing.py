@@ -0,0 +1,69 @@
+# Copyright (c) 2025, raion digital and Contributors
+# See license.txt
+
+"""Checks that read-only paths use the read replica.
+
+Runs against a second local database server standing in as the replica. Configure
+the test site with, for example::
+
+	bench --site test_site set-config read_from_replica 1
+	bench --site test_site set-config replica_host 127.0.0.1
+	bench --site test_site set-config replica_db_port 3307
+
+The tests are skipped when no replica is configured.
+"""
+
+import unittest
+from unittest.mock import patch
+
+import frappe
+from frappe.tests.utils import FrappeTestCase
+
+from monthly_productivity.monthly_productivity.doctype.monthly_productivity import (
+	monthly_productivity as mp_controller,
+)
+from monthly_productivity.monthly_productivity.report.monthly_productivity_summary import (
+	monthly_productivity_summary as summary_report,
+)
+from monthly_productivity.utils import replica_reads_enabled
+
+
+@unittest.skipUnless(
+	replica_reads_enabled() and frappe.conf.get("replica_host"), "no read replica configured for this site"
+)
+class TestReplicaRouting(FrappeTestCase):
+	def record_connection(self, module, fn_name):
+		"""Patch `module.fn_name` to record whether it ran on the replica connection."""
+		seen = []
+		original = getattr(module, fn_name)
+
+		def _spy(*args, **kwargs):
+			seen.append(frappe.db is getattr(frappe.local, "replica_db", None))
+			return original(*args, **kwargs)
+
+		return seen, patch.object(module, fn_name, _spy)
+
+	def test_summary_view_reads_from_replica(self):
+		seen, spy = self.record_connection(summary_report, "get_summary_data")
+		with spy:
+			summary_report.execute(
+				frappe._dict(
+					view_mode="Summary View",
+					company=frappe.db.get_value("Company", {}, "name"),
+					from_date="2025-01-01",
+					to_date="2025-12-31",
+				)
+			)
+		self.assertEqual(seen, [True])
+
+	def test_validation_lookup_stays_on_primary(self):
+		seen, spy = self.record_connection(mp_controller, "_get_previous_execution_total")
+		with spy, patch.dict(frappe.conf, {"monthly_productivity_validation_reads_on_primary": 1}):
+			mp_controller.get_previous_execution_total("_Test Invoice", "_Test Doc")
+		self.assertEqual(seen, [False])
+
+	def test_validation_lookup_can_use_replica(self):
+		seen, spy = self.record_connection(mp_controller, "_get_previous_execution_total")
+		with spy, patch.dict(frappe.conf, {"monthly_productivity_validation_reads_on_primary": 0}):
+			mp_controller.get_previous_execution_total("_Test Invoice", "_Test Doc")
+		self.assertEqual(seen, [True])
@@ -0,0 +1,147 @@
+# Copyright (c) 2025, raion digital and Contributors
+# See license.txt
+
+from unittest.mock import patch
+
+import frappe
+from frappe.tests.utils import FrappeTestCase
+from frappe.utils import flt
+
+from monthly_productivity.events import sales_invoice as sales_invoice_events
+from monthly_productivity.events.sales_invoice import on_cancel, on_submit, refresh_executed_values
+from monthly_productivity.monthly_productivity.doctype.monthly_productivity import (
+	monthly_productivity as mp_controller,
+)
+from monthly_productivity.monthly_productivity.doctype.monthly_productivity.monthly_productivity import (
+	get_net_invoice_total,
+)
+from monthly_productivity.tests.synthetic_data import make_dataset, make_unsaved_document
+
+
+class TestSalesInvoiceEvents(FrappeTestCase):
+	def test_refresh_updates_draft_rows_and_commissions(self):
+		dataset = make_dataset(prefix="_MP SI Events", sales_invoices=2, documents=1, rows_per_document=2)
+		doc = make_unsaved_document(dataset, rows=4)
+		doc.insert()
+
+		invoice = dataset.sales_invoices[0]
+		frappe.db.set_value("Sales Invoice", invoice, "grand_total", 2000)
+		refresh_executed_values(invoice)
+		doc.reload()
+
+		for row in doc.productivity:
+			if row.sales_invoice == invoice:
+				self.assertEqual(flt(row.invoice_total), 2000)
+				self.assertEqual(
+					flt(row.actual_executed_value), flt(2000 * row.execution_percentage / 100, 2)
+				)
+
+		base = flt(sum(flt(row.actual_executed_value) for row in doc.productivity), 2)
+		expected = sum(
+			round(base * flt(r.commission_percentage) / 100.0, 2) for r in doc.commission_breakdown
+		)
+		self.assertAlmostEqual(flt(doc.total_commission_amount), expected, places=2)
+
+	def test_manually_entered_executed_value_is_kept(self):
+		dataset = make_dataset(prefix="_MP SI Manual", sales_invoices=1, documents=1, rows_per_document=1)
+		doc = make_unsaved_document(dataset, rows=2)
+		doc.productivity[0].actual_executed_value = 123.45
+		doc.insert()
+
+		invoice = dataset.sales_invoices[0]
+		frappe.db.set_value("Sales Invoice", invoice, "grand_total", 2000)
+		refresh_executed_values(invoice)
+		doc.reload()
+
+		self.assertEqual(flt(doc.productivity[0].actual_executed_value), 123.45)
+		self.assertEqual(flt(doc.productivity[0].invoice_total), 2000)
+		self.assertEqual(
+			flt(doc.productivity[1].actual_executed_value),
+			flt(2000 * doc.productivity[1].execution_percentage / 100, 2),
+		)
+
+	def test_amendment_moves_rows_to_the_new_invoice(self):
+		dataset = make_dataset(prefix="_MP SI Amend", sales_invoices=1, documents=1, rows_per_document=1)
+		doc = make_unsaved_document(dataset, rows=2)
+		doc.insert()
+
+		original = dataset.sales_invoices[0]
+		amended = f"{original}-1"
+		frappe.db.sql(
+			"""
+			INSERT INTO `tabSales Invoice` (name, company, customer, grand_total, amended_from, docstatus)
+			VALUES (%s, %s, %s, 3000, %s, 1)
+			""",
+			(amended, dataset.company, dataset.invoices[0].customer, original),
+		)
+		on_submit(frappe._dict(name=amended, amended_from=original))
+		doc.reload()
+
+		for row in doc.productivity:
+			self.assertEqual(row.sales_invoice, amended)
+			self.assertEqual(flt(row.invoice_total), 3000)
+
+	def test_hooks_route_returns_and_amendments(self):
+		with patch.object(sales_invoice_events, "refresh_executed_values") as refresh:
+			on_submit(frappe._dict(name="SINV-RET", is_return=1, return_against="SINV-0001"))
+			refresh.assert_called_once_with("SINV-0001")
+
+			refresh.reset_mock()
+			on_cancel(frappe._dict(name="SINV-RET", is_return=1, return_against="SINV-0001"))
+			refresh.assert_called_once_with("SINV-0001")
+
+			refresh.reset_mock()
+			on_submit(frappe._dict(name="SINV-0001-1", amended_from="SINV-0001"))
+			refresh.assert_called_once_with("SINV-0001-1", previous_invoice="SINV-0001")
+
+			refresh.reset_mock()
+			on_submit(frappe._dict(name="SINV-0002"))
+			on_cancel(frappe._dict(name="SINV-0002", amended_from="SINV-0001"))
+			refresh.assert_not_called()
+
+	def test_submitted_return_nets_the_invoice_total(self):
+		dataset = make_dataset(prefix="_MP SI Return", sales_invoices=1, documents=1, rows_per_document=1)
+		doc = make_unsaved_document(dataset, rows=2)
+		doc.insert()
+
+		invoice = dataset.invoices[0]
+		return_invoice = f"{invoice.name}-RET"
+		frappe.db.sql(
+			"""
+			INSERT INTO `tabSales Invoice` (name, company, customer, grand_total, is_return, return_against, docstatus)
+			VALUES (%s, %s, %s, -400, 1, %s, 1)
+			""",
+			(return_invoice, dataset.company, invoice.customer, invoice.name),
+		)
+		net_total = flt(invoice.grand_total - 400, 2)
+		self.assertEqual(flt(get_net_invoice_total(invoice.name), 2), net_total)
+
+		on_submit(frappe._dict(name=return_invoice, is_return=1, return_against=invoice.name))
+		doc.reload()
+		for row in doc.productivity:
+			self.assertEqual(flt(row.invoice_total, 2), net_total)
+			self.assertEqual(
+				flt(row.actual_executed_value), flt(net_total * row.execution_percentage / 100, 2)
+			)
+
+		frappe.db.set_value("Sales Invoice", return_invoice, "docstatus", 2)
+		on_cancel(frappe._dict(name=return_invoice, is_return=1, return_against=invoice.name))
+		doc.reload()
+		for row in doc.productivity:
+			self.assertEqual(flt(row.invoice_total, 2), flt(invoice.grand_total, 2))
+
+	def test_validate_fills_net_invoice_total_once_per_invoice(self):
+		dataset = make_dataset(prefix="_MP SI Fill", sales_invoices=1, documents=1, rows_per_document=1)
+		doc = make_unsaved_document(dataset, rows=3)
+		for row in doc.productivity:
+			row.invoice_total = 0
+
+		with patch.object(
+			mp_controller, "get_net_invoice_total", wraps=mp_controller.get_net_invoice_total
+		) as net_total:
+			doc.validate()
+
+		net_total.assert_called_once_with(dataset.sales_invoices[0])
+		self.assertTrue(
+			all(flt(row.invoice_total) == flt(dataset.invoices[0].grand_total) for row in doc.productivity)
+		)
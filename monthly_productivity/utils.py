@@ -0,0 +1,40 @@
+# Copyright (c) 2025, raion digital and contributors
+# For license information, please see license.txt
+
+import functools
+
+import frappe
+from frappe.utils import cint
+
+
+def replica_reads_enabled() -> bool:
+	return bool(cint(frappe.conf.get("read_from_replica")))
+
+
+def keep_validation_reads_on_primary() -> bool:
+	"""Site config flag, on by default, that keeps validation-critical reads off the replica."""
+	return bool(cint(frappe.conf.get("monthly_productivity_validation_reads_on_primary", 1)))
+
+
+def read_only(validation_critical=False):
+	"""Route the decorated read-only function to the read replica when one is configured.
+
+	Wraps `frappe.read_only`, which switches `frappe.db` to the connection given by
+	`replica_host` / `replica_db_port` when `read_from_replica` is set in site config.
+	Functions marked `validation_critical` keep reading from the primary while
+	`monthly_productivity_validation_reads_on_primary` is enabled, so a lagging replica
+	cannot let a 100% execution check pass.
+	"""
+
+	def decorator(fn):
+		replica_fn = frappe.read_only()(fn)
+
+		@functools.wraps(fn)
+		def wrapper(*args, **kwargs):
+			if validation_critical and keep_validation_reads_on_primary():
+				return fn(*args, **kwargs)
+			return replica_fn(*args, **kwargs)
+
+		return wrapper
+
+	return decorator